@@ -3,22 +3,30 @@
 
 import json
 import math
-import ssl
-from datetime import datetime, timezone
+import time
+from datetime import timezone
+from pathlib import Path
 
 import folium
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import pytz
 import requests
 import streamlit as st
 import streamlit.components.v1 as components
+from folium.plugins import FastMarkerCluster, HeatMap
 from geopy.geocoders import Nominatim
-from streamlit_folium import st_folium
-from streamlit_autorefresh import st_autorefresh
+from requests.adapters import HTTPAdapter
 from timezonefinder import TimezoneFinder
+from urllib3.util import Retry
 import pycountry
 
+try:
+    # Optional fast parser for the multi-MB weekly feeds
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # ------------------- Constants -------------------
 USGS_FEEDS = {
     "Past Hour (all)": "https://earthquake.usgs.gov/earthquakes/feed/v1.0/summary/all_hour.geojson",
@@ -57,51 +65,189 @@ GMT_REFERENCE = {
     13: "Samoa, Tonga",
     14: "Kiribati",
 }
+GMT_OPTIONS = tuple(f"GMT{offset:+d} ({ref})" for offset, ref in GMT_REFERENCE.items())
+GMT_DEFAULT_INDEX = GMT_OPTIONS.index("GMT+0 (London, Lisbon, Accra)")
+
+EARTH_RADIUS_KM = 6371.0088
+
+COUNTRY_CENTROIDS_FILE = Path(__file__).with_name("country_centroids.json")
+
+# Above this many events the map switches from individual markers to a heat layer
+HEATMAP_MIN_EVENTS = 500
+
+# Leaflet marker for a [lat, lon, mag, tooltip, color] row
+QUAKE_MARKER_JS = """
+function (row) {
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: 4 + row[2], color: row[4], fillColor: row[4], fillOpacity: 0.7
+    });
+    marker.bindTooltip(row[3]);
+    return marker;
+}
+"""
 
 # ------------------- Utilities -------------------
-def haversine_km(lat1, lon1, lat2, lon2):
-    R = 6371.0088
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi, dl = math.radians(lat2 - lat1), math.radians(lon2 - lon1)
-    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dl / 2) ** 2
-    return 2 * R * math.asin(math.sqrt(a))
-
-def fetch_geojson(url, timeout=10):
-    # Small resilient fetch with a single retry
-    ctx = ssl.create_default_context()
-    headers = {"User-Agent": "QuakeWatch/1.0"}
-    try:
-        from urllib.request import urlopen, Request
-        req = Request(url, headers=headers)
-        with urlopen(req, timeout=timeout, context=ctx) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except Exception:
-        # Retry once via requests
-        r = requests.get(url, headers=headers, timeout=timeout)
-        r.raise_for_status()
-        return r.json()
+def haversine_np(lat1, lon1, lat2, lon2):
+    # Vectorized great circle distance, works on scalars or NumPy arrays
+    R = EARTH_RADIUS_KM
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    dlat, dlon = lat2 - lat1, lon2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * R * np.arcsin(np.sqrt(a))
+
+def radius_bbox_mask(lat0, lon0, lats, lons, radius_km):
+    # Lat/lon box enclosing the whole search circle; cheap compares that spare the trig for far away points
+    ang = radius_km / EARTH_RADIUS_KM
+    eps = 1e-6
+    inside = np.abs(lats - lat0) <= math.degrees(ang) + eps
+    phi0 = math.radians(lat0)
+    if abs(phi0) + ang >= math.pi / 2:
+        # The circle reaches a pole, so every longitude is in range
+        return inside
+    dlon = math.degrees(math.asin(math.sin(ang) / math.cos(phi0)))
+    return inside & (np.abs((lons - lon0 + 180) % 360 - 180) <= dlon + eps)
+
+@st.cache_resource
+def _feed_cache():
+    # url -> (etag, last_modified, events frame) of the last full download, shared across reruns
+    return {}
+
+@st.cache_resource
+def http_session():
+    # Shared keep-alive connection pool for USGS and ipinfo, so refreshes skip the TCP and TLS handshake
+    s = requests.Session()
+    # Keeps requests' default Accept-Encoding: gzip/deflate, plus br via the brotli requirement
+    s.headers.update({"User-Agent": "QuakeWatch/1.0"})
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                          max_retries=Retry(total=1, backoff_factor=0.3))
+    s.mount("https://", adapter)
+    return s
+
+def events_frame(features):
+    # One row per feature holding only the fields we use; distance and filter are column ops
+    quakes = pd.DataFrame({
+        "id": [f.get("id") or f["properties"].get("code") or f["properties"].get("ids", "") for f in features],
+        "mag": np.array([f["properties"]["mag"] or 0.0 for f in features], dtype=float),
+        "place": [f["properties"]["place"] or "Unknown location" for f in features],
+        "time": np.array([f["properties"]["time"] for f in features], dtype="i8"),
+        "lat": np.array([f["geometry"]["coordinates"][1] for f in features], dtype=float),
+        "lon": np.array([f["geometry"]["coordinates"][0] for f in features], dtype=float),
+    })
+    # Newest first once per download; the per-rerun masks keep this order
+    return quakes.sort_values("time", ascending=False, ignore_index=True)
+
+@st.cache_data(ttl=300, max_entries=16, show_spinner=False)
+def load_events(url, refresh_bucket, timeout=10):
+    # refresh_bucket only keys the cache: one fetch and parse per refresh window, so
+    # moving the radius or magnitude sliders reuses the parsed frame
+    headers = {}
+    cached = _feed_cache().get(url)
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    r = http_session().get(url, headers=headers, timeout=timeout)
+    if r.status_code == 304 and cached:
+        return cached[2]
+    r.raise_for_status()
+    # The raw GeoJSON is dropped here; only the compact frame is kept for revalidation
+    quakes = events_frame(json_loads(r.content).get("features", []))
+    _feed_cache()[url] = (r.headers.get("ETag"), r.headers.get("Last-Modified"), quakes)
+    return quakes
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _ip_location():
+    # Raises on network errors, error replies and replies without a location so failures are not cached
+    r = http_session().get("https://ipinfo.io/json", timeout=5)
+    r.raise_for_status()
+    data = r.json()
+    if "loc" not in data:
+        raise ValueError("ipinfo reply has no location")
+    lat, lon = map(float, data["loc"].split(","))
+    city = data.get("city") or ""
+    country = data.get("country") or ""
+    label = ", ".join([x for x in [city, country] if x]) or "IP location"
+    return lat, lon, label
 
 def geo_from_ip():
     try:
-        r = requests.get("https://ipinfo.io/json", timeout=5)
-        data = r.json()
-        if "loc" in data:
-            lat, lon = map(float, data["loc"].split(","))
-            city = data.get("city") or ""
-            country = data.get("country") or ""
-            label = ", ".join([x for x in [city, country] if x]) or "IP location"
-            return lat, lon, label
+        return _ip_location()
     except Exception:
-        pass
-    return 14.5995, 120.9842, "Manila (fallback)"
+        return 14.5995, 120.9842, "Manila (fallback)"
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def geocode_country(name):
+    # (lat, lon) of the country, or None when Nominatim has no match
+    loc = Nominatim(user_agent="quake_watch").geocode(name, timeout=10)
+    if loc:
+        return loc.latitude, loc.longitude
+    return None
+
+@st.cache_resource
+def country_centroids():
+    # ISO alpha-2 -> [lat, lon] shipped with the app, so picking a country needs no network call
+    try:
+        return json.loads(COUNTRY_CENTROIDS_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def country_location(name):
+    code = pycountry.countries.lookup(name).alpha_2
+    centroid = country_centroids().get(code)
+    if centroid is None:
+        # The few territories missing from the table fall back to the cached Nominatim lookup
+        return geocode_country(name)
+    lat, lon = centroid
+    return lat, lon
+
+@st.cache_resource
+def country_list():
+    return sorted(c.name for c in pycountry.countries)
+
+@st.cache_resource
+def _timezone_finder():
+    # Loads the timezone polygon index once per process
+    return TimezoneFinder()
+
+@st.cache_data
+def _timezone_name(lat, lon):
+    return _timezone_finder().timezone_at(lat=lat, lng=lon)
 
 def get_timezone(lat, lon):
-    tf = TimezoneFinder()
-    tz_name = tf.timezone_at(lat=lat, lng=lon)
+    # Rounded to 0.1 degree so small location jitter reuses the cached lookup
+    tz_name = _timezone_name(round(lat, 1), round(lon, 1))
     if tz_name:
         return pytz.timezone(tz_name), tz_name
     return timezone.utc, "UTC"
 
+@st.cache_data(ttl=300, show_spinner=False, max_entries=32)
+def build_map_html(user_lat, user_lon, user_label, events_sig, _quakes):
+    # events_sig stands in for _quakes in the cache key, which Streamlit skips hashing
+    m = folium.Map(location=[user_lat, user_lon], zoom_start=4, tiles="CartoDB positron")
+    folium.Marker(
+        [user_lat, user_lon],
+        tooltip=f"You: {user_label}",
+        icon=folium.Icon(color="blue"),
+    ).add_to(m)
+
+    if len(_quakes) > HEATMAP_MIN_EVENTS:
+        # Dense feeds: one canvas heat layer weighted by magnitude instead of thousands of markers
+        mags = _quakes["mag"].to_numpy()
+        heat = np.column_stack([_quakes["lat"].to_numpy(), _quakes["lon"].to_numpy(), mags / mags.max()])
+        HeatMap(heat.tolist(), radius=12, min_opacity=0.3).add_to(m)
+    else:
+        # One clustered layer; Leaflet builds the circle markers from plain rows in the browser
+        times = _quakes["t_disp"].dt.strftime("%Y-%m-%d %H:%M:%S")
+        rows = [
+            [lat, lon, mag, f"M{mag:.1f} {place} • {t}", color]
+            for lat, lon, mag, place, t, color in zip(
+                _quakes["lat"], _quakes["lon"], _quakes["mag"], _quakes["place"], times, _quakes["color"])
+        ]
+        FastMarkerCluster(rows, callback=QUAKE_MARKER_JS).add_to(m)
+    return m.get_root().render()
+
 def play_beep():
     # Lightweight in browser beep using Web Audio API
     components.html(
@@ -156,7 +302,6 @@ st.sidebar.header("⏱️ Refresh")
 refresh_rate = st.sidebar.slider("Auto refresh interval (seconds)", 15, 300, 60, 15)
 enable_refresh = st.sidebar.checkbox("Enable auto refresh", value=True)
 if enable_refresh:
-    st_autorefresh(interval=refresh_rate * 1000, key="refresh_counter")
     st.caption(f"🔄 Auto refreshing every {refresh_rate} seconds")
 
 st.sidebar.header("🚨 Alerts")
@@ -173,13 +318,11 @@ if loc_mode == "Auto IP":
     user_lat, user_lon, user_label = geo_from_ip()
     st.sidebar.success(f"Using location: {user_label}")
 elif loc_mode == "Select Country":
-    countries = sorted([c.name for c in pycountry.countries])
-    country = st.sidebar.selectbox("Country", countries)
-    geolocator = Nominatim(user_agent="quake_watch")
+    country = st.sidebar.selectbox("Country", country_list())
     try:
-        loc = geolocator.geocode(country, timeout=10)
+        loc = country_location(country)
         if loc:
-            user_lat, user_lon, user_label = loc.latitude, loc.longitude, country
+            (user_lat, user_lon), user_label = loc, country
         else:
             user_lat, user_lon, user_label = 14.5995, 120.9842, "Manila (fallback)"
     except Exception:
@@ -204,154 +347,125 @@ with colf3:
 st.markdown("#### 🕒 Time Display")
 time_mode = st.radio("Show times as", ["Local Time", "UTC", "Select GMT Offset"], horizontal=True)
 
-selected_tz = None
+# Resolved once; every event timestamp is converted to it in a single column op
+display_tz = timezone.utc if time_mode == "UTC" else local_tz
 if time_mode == "Select GMT Offset":
-    options = [f"GMT{offset:+d} ({ref})" for offset, ref in GMT_REFERENCE.items()]
-    default_idx = options.index("GMT+0 (London, Lisbon, Accra)")
-    gmt_choice = st.selectbox("GMT offset", options, index=default_idx)
+    gmt_choice = st.selectbox("GMT offset", GMT_OPTIONS, index=GMT_DEFAULT_INDEX)
     gmt_offset = int(gmt_choice.split()[0].replace("GMT", ""))
-    selected_tz = pytz.FixedOffset(gmt_offset * 60)
-
-# Fetch and process events
-raw = fetch_geojson(USGS_FEEDS[feed])
-events = []
-new_alerts = []
-
-for f in raw.get("features", []):
-    fid = f.get("id") or f["properties"].get("code") or f["properties"].get("ids", "")
-    lon, lat = f["geometry"]["coordinates"][:2]
-    mag = f["properties"]["mag"] or 0.0
-    place = f["properties"]["place"] or "Unknown location"
-    t_utc = datetime.utcfromtimestamp(f["properties"]["time"] / 1000).replace(tzinfo=timezone.utc)
-
-    if time_mode == "Local Time":
-        t_disp = t_utc.astimezone(local_tz)
-    elif time_mode == "UTC":
-        t_disp = t_utc
+    display_tz = pytz.FixedOffset(gmt_offset * 60)
+
+# Feed section. With auto refresh on only this fragment reruns on the timer; sidebar
+# widgets, location lookup and timezone resolution are kept from the last full run.
+@st.fragment(run_every=refresh_rate if enable_refresh else None)
+def live_feed():
+    # Fetch and process events
+    quakes = load_events(USGS_FEEDS[feed], int(time.time() // refresh_rate))
+    seen_ids = st.session_state["seen_ids"]
+
+    candidates = (quakes["mag"].to_numpy() >= min_mag) & radius_bbox_mask(
+        user_lat, user_lon, quakes["lat"].to_numpy(), quakes["lon"].to_numpy(), radius)
+    quakes = quakes[candidates]
+    quakes = quakes.assign(dist=haversine_np(user_lat, user_lon, quakes["lat"].to_numpy(), quakes["lon"].to_numpy()))
+    # Still newest first; table, map and chart all read columns of this frame
+    quakes = quakes[quakes["dist"] <= radius].reset_index(drop=True)
+    quakes["t_utc"] = pd.to_datetime(quakes["time"], unit="ms", utc=True)
+    quakes["t_disp"] = quakes["t_utc"].dt.tz_convert(display_tz)
+    # Magnitude color bins (CSS green/orange/red as hex), shared by the table, map and chart
+    quakes["color"] = np.select([quakes["mag"] < 4, quakes["mag"] < 6], ["#008000", "#ffa500"], default="#ff0000")
+
+    # New event alerts
+    new_alerts = quakes[(quakes["mag"] >= alert_min_mag) & ~quakes["id"].isin(seen_ids)]
+
+    # Handle alerts
+    if not new_alerts.empty:
+        for q in new_alerts.head(3).itertuples(index=False):
+            st.warning(f"New quake M{q.mag:.1f} • {q.place} • {q.t_disp.strftime('%Y-%m-%d %H:%M:%S')} • {q.dist:.0f} km")
+        st.toast(f"{len(new_alerts)} new earthquake(s) ≥ M{alert_min_mag:.1f} detected", icon="⚠️")
+        if alert_sound:
+            play_beep()
+        if alert_desktop:
+            first = new_alerts.iloc[0]
+            desktop_notify(
+                "New earthquake detected",
+                f"M{first['mag']:.1f} — {first['place']} — {first['t_disp'].strftime('%Y-%m-%d %H:%M:%S')}"
+            )
+
+    # Update seen ids after processing to avoid double alerts on same load
+    seen_ids.update(quakes["id"])
+
+    # Events table with pagination
+    st.subheader(f"📝 Earthquake events near {user_label}")
+
+    if not quakes.empty:
+        # Pagination controls
+        topcol1, topcol2, topcol3, topcol4 = st.columns([1, 1, 2, 2])
+        with topcol1:
+            page_size = st.selectbox("Rows", [10, 20, 50, 100], index=0)
+        total_pages = max(1, math.ceil(len(quakes) / page_size))
+        st.session_state["page"] = min(st.session_state["page"], total_pages)
+
+        with topcol2:
+            st.write(f"Page {st.session_state['page']}/{total_pages}")
+
+        with topcol3:
+            if st.button("⬅ Prev", disabled=(st.session_state["page"] <= 1)):
+                st.session_state["page"] -= 1
+        with topcol4:
+            if st.button("Next ➡", disabled=(st.session_state["page"] >= total_pages)):
+                st.session_state["page"] += 1
+
+        start = (st.session_state["page"] - 1) * page_size
+        end = start + page_size
+        page_events = quakes.iloc[start:end].reset_index(drop=True)
+
+        df = pd.DataFrame({
+            "Time": page_events["t_disp"].dt.strftime("%Y-%m-%d %H:%M:%S"),
+            "Magnitude": page_events["mag"],
+            "Place": page_events["place"],
+            # Display-only columns; float32 halves what st.dataframe ships to the browser
+            "Lat": page_events["lat"].astype("float32"),
+            "Lon": page_events["lon"].astype("float32"),
+            "Dist (km)": page_events["dist"].astype("float32"),
+        })
+
+        # Magnitude text colors for the whole page at once, strongest bin in bold
+        colors = page_events["color"].to_numpy()
+        mag_styles = np.where(colors == "#ff0000", "color: #ff0000; font-weight: bold", "color: " + colors)
+        styled = df.style.apply(lambda _col: mag_styles, subset=["Magnitude"]).format({
+            "Magnitude": "{:.1f}",
+            "Lat": "{:.2f}",
+            "Lon": "{:.2f}",
+            "Dist (km)": "{:.1f}",
+        })
+        st.dataframe(styled, use_container_width=True, height=400)
+
+        # Map and Chart
+        mapcol, chartcol = st.columns([2, 1])
+
+        with mapcol:
+            st.subheader("🗺️ Map")
+            # Only rebuilt when the location, display timezone or a plotted field (incl. relocated hypocenters) changes
+            shown = quakes[["id", "time", "mag", "place", "lat", "lon"]]
+            events_sig = (str(display_tz), int(pd.util.hash_pandas_object(shown, index=False).sum()))
+            components.html(build_map_html(user_lat, user_lon, user_label, events_sig, quakes), height=520)
+
+        with chartcol:
+            st.subheader("📈 Magnitude Trend (page)")
+            # Rendered client side by Vega-Lite; naive wall-clock times keep the display timezone
+            mags = np.round(page_events["mag"].to_numpy(), 1)
+            trend = pd.DataFrame({
+                "Time": page_events["t_disp"].dt.tz_localize(None),
+                "Magnitude": mags,
+                "Color": page_events["color"],
+                "Size": 20 + mags * 10,
+            })
+            st.scatter_chart(trend, x="Time", y="Magnitude", color="Color", size="Size")
+
     else:
-        t_disp = t_utc.astimezone(selected_tz or local_tz)
-
-    dist = haversine_km(user_lat, user_lon, lat, lon)
-
-    if mag >= min_mag and dist <= radius:
-        events.append((fid, t_disp, mag, place, lat, lon, dist, t_utc))
-
-        # New event alerts
-        if fid not in st.session_state["seen_ids"] and mag >= alert_min_mag:
-            new_alerts.append((fid, t_disp, mag, place, dist))
-
-# Sort newest first
-events.sort(key=lambda e: e[1], reverse=True)
-
-# Handle alerts
-if new_alerts:
-    for _fid, t_disp, mag, place, dist in new_alerts[:3]:
-        st.sidebar.warning(f"New quake M{mag:.1f} • {place} • {t_disp.strftime('%Y-%m-%d %H:%M:%S')} • {dist:.0f} km")
-    st.toast(f"{len(new_alerts)} new earthquake(s) ≥ M{alert_min_mag:.1f} detected", icon="⚠️")
-    if alert_sound:
-        play_beep()
-    if alert_desktop:
-        first = new_alerts[0]
-        desktop_notify(
-            "New earthquake detected",
-            f"M{first[2]:.1f} — {first[3]} — {first[1].strftime('%Y-%m-%d %H:%M:%S')}"
-        )
-
-# Update seen ids after processing to avoid double alerts on same load
-for e in events:
-    st.session_state["seen_ids"].add(e[0])
-
-# Events table with pagination
-st.subheader(f"📝 Earthquake events near {user_label}")
-
-if events:
-    # Pagination controls
-    topcol1, topcol2, topcol3, topcol4 = st.columns([1, 1, 2, 2])
-    with topcol1:
-        page_size = st.selectbox("Rows", [10, 20, 50, 100], index=0)
-    total_pages = max(1, math.ceil(len(events) / page_size))
-    st.session_state["page"] = min(st.session_state["page"], total_pages)
-
-    with topcol2:
-        st.write(f"Page {st.session_state['page']}/{total_pages}")
-
-    with topcol3:
-        if st.button("⬅ Prev", disabled=(st.session_state["page"] <= 1)):
-            st.session_state["page"] -= 1
-    with topcol4:
-        if st.button("Next ➡", disabled=(st.session_state["page"] >= total_pages)):
-            st.session_state["page"] += 1
-
-    start = (st.session_state["page"] - 1) * page_size
-    end = start + page_size
-    page_events = events[start:end]
-
-    df = pd.DataFrame([{
-        "Time": e[1].strftime("%Y-%m-%d %H:%M:%S"),
-        "Magnitude": e[2],
-        "Place": e[3],
-        "Lat": e[4],
-        "Lon": e[5],
-        "Dist (km)": e[6],
-    } for e in page_events])
-
-    def mag_style(val):
-        if isinstance(val, (int, float)):
-            if val < 4:
-                return "color: green"
-            elif val < 6:
-                return "color: orange"
-            else:
-                return "color: red; font-weight: bold"
-        return ""
-
-    styled = df.style.applymap(mag_style, subset=["Magnitude"]).format({
-        "Magnitude": "{:.1f}",
-        "Lat": "{:.2f}",
-        "Lon": "{:.2f}",
-        "Dist (km)": "{:.1f}",
-    })
-    st.dataframe(styled, use_container_width=True, height=400)
-
-    # Map and Chart
-    mapcol, chartcol = st.columns([2, 1])
-
-    with mapcol:
-        st.subheader("🗺️ Map")
-        m = folium.Map(location=[user_lat, user_lon], zoom_start=4, tiles="CartoDB positron")
-        folium.Marker(
-            [user_lat, user_lon],
-            tooltip=f"You: {user_label}",
-            icon=folium.Icon(color="blue"),
-        ).add_to(m)
-
-        for _fid, t_disp, mag, place, lat, lon, dist, _tutc in events:
-            color = "green" if mag < 4 else "orange" if mag < 6 else "red"
-            folium.CircleMarker(
-                [lat, lon],
-                radius=4 + mag,
-                color=color,
-                fill=True,
-                fill_color=color,
-                fill_opacity=0.7,
-                tooltip=f"M{mag:.1f} {place} • {t_disp.strftime('%Y-%m-%d %H:%M:%S')}",
-            ).add_to(m)
-        st_folium(m, width=900, height=520)
-
-    with chartcol:
-        st.subheader("📈 Magnitude Trend (page)")
-        times = [e[1] for e in page_events]
-        mags = [round(e[2], 1) for e in page_events]
-        fig, ax = plt.subplots(figsize=(6, 4))
-        ax.plot(times, mags, marker="o")
-        ax.set_xlabel("Time")
-        ax.set_ylabel("Magnitude")
-        ax.grid(True, linestyle=":")
-        fig.autofmt_xdate()
-        st.pyplot(fig)
+        st.info("No earthquake events found in this range.")
 
-else:
-    st.info("No earthquake events found in this range.")
+
+live_feed()
 
 st.markdown(
     "<div style='opacity:0.6'>Data © USGS Earthquake Hazards Program — feed latency can be 1 to several minutes.</div>",